@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+import gc
+import weakref
 from typing import TYPE_CHECKING, cast
 
 import pytest
@@ -17,6 +19,7 @@ from weba import (
     ComponentTagNotFoundError,
     ComponentTypeError,
     Tag,
+    Ui,
     no_tag_context,
     tag,
     ui,
@@ -1058,6 +1061,24 @@ def test_component_replace_with():
     assert "Hello, World!" in str(html)
 
 
+@pytest.mark.asyncio
+async def test_component_await_sync_component_renders_once():
+    class SyncComponent(Component):
+        src = "<div></div>"
+
+        def __init__(self):
+            self.renders = 0
+
+        def render(self):
+            self.renders += 1
+            self.append(ui.span("rendered"))
+
+    component = await SyncComponent()
+
+    assert component.renders == 1
+    assert str(component) == "<div><span>rendered</span></div>"
+
+
 @pytest.mark.asyncio
 async def test_component_async_callable_src_current_parent_context():
     """Test that src can be a callable that returns HTML."""
@@ -1434,6 +1455,8 @@ def test_component_parse_content():
 def test_component_parse_source_content_with_caching(monkeypatch: MonkeyPatch, tmp_path: Path):
     with monkeypatch.context() as mp:
         mp.setenv("WEBA_LRU_CACHE_SIZE", "10")
+        mp.setattr(Ui, "_cache_size", 10)
+        mp.setattr(Ui, "_raw_cache", None)
         content = "<!DOCTYPE html>\n<div>Test</div>"
 
         # Test direct content with caching
@@ -1452,6 +1475,8 @@ def test_component_parse_source_content_with_caching(monkeypatch: MonkeyPatch, t
 def test_component_parse_source_content_without_caching(monkeypatch: MonkeyPatch, tmp_path: Path):
     with monkeypatch.context() as mp:
         mp.setenv("WEBA_LRU_CACHE_SIZE", "")
+        mp.setattr(Ui, "_cache_size", None)
+        mp.setattr(Ui, "_raw_cache", None)
         content = "<!DOCTYPE html>\n<div>Test</div>"
 
         # Test direct content without caching
@@ -1470,6 +1495,8 @@ def test_component_parse_source_content_without_caching(monkeypatch: MonkeyPatch
 def test_component_parse_source_content_edge_cases(monkeypatch: MonkeyPatch, tmp_path: Path):
     with monkeypatch.context() as mp:
         mp.setenv("WEBA_LRU_CACHE_SIZE", "10")
+        mp.setattr(Ui, "_cache_size", 10)
+        mp.setattr(Ui, "_raw_cache", None)
 
         # Test with empty content (direct)
         result = Component._parse_source_content("")  # pyright: ignore[reportPrivateUsage]
@@ -1541,3 +1568,19 @@ def test_component_appending_multiple_tags_from_ui_raw():
 
     assert '<script foo="bar" src="script1.js"></script>' in layout_html
     assert '<script foo="bar" src="script2.js"></script>' in layout_html
+
+
+def test_component_src_dir_is_cached_on_the_class():
+    def make_component() -> weakref.ref[type[Component]]:
+        class Dynamic(Component):
+            src = "<div></div>"
+
+        assert Dynamic._get_src_dir() == Dynamic.__dict__["_src_dir"]  # pyright: ignore[reportPrivateUsage]
+
+        return weakref.ref(Dynamic)
+
+    component_ref = make_component()
+    gc.collect()
+
+    # Nothing outside the class holds on to it, so classes built on the fly can still be freed
+    assert component_ref() is None
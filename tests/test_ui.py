@@ -4,8 +4,9 @@ import asyncio
 import json
 
 import pytest
+from bs4 import NavigableString, SoupStrainer
 
-from weba import Tag, ui
+from weba import Tag, Ui, current_tag_context, ui
 
 # pyright: reportArgumentType=false, reportOptionalSubscript=false, reportUnknownArgumentType=false
 
@@ -59,6 +60,34 @@ def test_ui_context_isolation():
     assert expected in str(outer)
 
 
+def test_ui_context_reentering_the_same_tag():
+    container = ui.div()
+
+    with container:
+        ui.p("one")
+
+        with container:
+            ui.p("two")
+
+        assert current_tag_context.get() is container
+
+    assert current_tag_context.get() is None
+
+    # Tags created after the block aren't added to the container
+    ui.p("three")
+
+    assert str(container) == "<div><p>one</p><p>two</p></div>"
+
+
+def test_ui_context_exit_without_enter():
+    with ui.section() as outer:
+        ui.div().__exit__(None, None, None)
+
+        assert current_tag_context.get() is outer
+
+    assert current_tag_context.get() is None
+
+
 @pytest.mark.asyncio
 async def test_ui_async_context_isolation():
     async def task1():
@@ -94,6 +123,9 @@ def test_ui_attributes():
 
     assert str(div2) == "<div hx-boost></div>"
 
+    # False boolean attributes are left off
+    assert str(ui.button(disabled=False, hx_boost=True)) == "<button hx-boost></button>"
+
     # Test nested elements with attributes
     with ui.div(class_="outer") as div3:
         ui.p(class_="inner", data_value="test")
@@ -118,6 +150,21 @@ def test_ui_class_manipulation():
     assert 'class="highlight text-xl"' in str(hello_tag)
 
 
+def test_ui_class_list_is_reused_and_not_shared_with_copies():
+    card = ui.div(class_="card")
+    assert card["class"] is card["class"]
+
+    card_copy = card.copy()
+    card["class"].append("active")
+    card_copy["class"].append("muted")
+
+    assert str(card) == '<div class="card active"></div>'
+    assert str(card_copy) == '<div class="card muted"></div>'
+
+    card["class"] = "replaced"
+    assert card["class"] == ["replaced"]
+
+
 def test_ui_value_to_string_conversion():
     number_tag = ui.p(123)
     assert str(number_tag) == "<p>123</p>"
@@ -138,6 +185,19 @@ def test_ui_value_to_string_conversion():
     assert str(date_tag) == "<p>2024-12-25 12:00:00</p>"
 
 
+def test_ui_tag_factory_is_reused():
+    fresh_ui = Ui()
+
+    assert fresh_ui.section is fresh_ui.section
+    assert str(fresh_ui.section("one")) == "<section>one</section>"
+    assert str(fresh_ui.section("two", class_="b")) == '<section class="b">two</section>'
+
+
+def test_ui_trailing_underscore_is_stripped_from_tag_name():
+    assert ui.input_(type="text").name == "input"
+    assert str(ui.del_("old")) == "<del>old</del>"
+
+
 def test_ui_htmx_search_form():
     with ui.form() as form:
         ui.input_(
@@ -339,6 +399,45 @@ def test_ui_list_operations():  # sourcery skip: no-loop-in-tests
     assert str(list_tag) == "<ul><li>Item 1</li></ul>"
 
 
+def test_ui_extend_moves_elements_between_trees():
+    with ui.main() as main:
+        with ui.div() as target:
+            ui.p("existing")
+        ui.footer("after")
+
+    source = ui.raw("<section><span>moved</span><b><i>nested</i></b></section>")
+    target.extend([*source.children, "text"])
+
+    assert (
+        str(main)
+        == "<main><div><p>existing</p><span>moved</span><b><i>nested</i></b>text</div><footer>after</footer></main>"
+    )
+    assert str(source) == "<section></section>"
+    assert [str(node) for node in main.descendants if isinstance(node, str)] == [
+        "existing",
+        "moved",
+        "nested",
+        "text",
+        "after",
+    ]
+    assert main.find("i").find_next("footer") is main.footer  # pyright: ignore[reportOptionalMemberAccess]
+
+
+def test_ui_extend_with_repeated_element():
+    first = ui.span("b")
+    container = ui.div(first)
+    tag = ui.span("a")
+
+    container.extend([tag, tag])
+
+    # Like bs4, the element ends up in the tree once
+    assert [id(child) for child in container.contents] == [id(first), id(tag)]
+    assert str(container) == "<div><span>b</span><span>a</span></div>"
+    assert tag.previous_sibling is first
+    assert tag.next_sibling is None
+    assert [id(node) for node in container.descendants] == [id(first), id(first.string), id(tag), id(tag.string)]
+
+
 def test_ui_tag_attributes():
     # Test non-class attribute access
     with ui.div(id="test", data_value="123") as div:
@@ -413,6 +512,55 @@ def test_ui_raw_html():
     assert str(container) == "<div><p>First paragraph</p><p>Second paragraph</p></div>"
 
 
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_ui_raw_simple_tag(parser: str):
+    with ui.div() as container:
+        br = ui.raw("<br>", parser=parser)
+        section = ui.raw(" <SECTION></SECTION> ", parser=parser)
+        hr = ui.raw("<hr />", parser=parser)
+
+    assert (br.name, section.name, hr.name) == ("br", "section", "hr")
+    assert not br.contents
+    assert [id(c) for c in container.contents] == [id(br), id(section), id(hr)]
+
+
+def test_ui_raw_simple_tag_lxml_wrapped():
+    # lxml puts frame tags inside an html tag, so those still go through the parser
+    assert ui.raw("<frameset>", parser="lxml").name == "html"
+
+
+def test_ui_raw_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Ui, "_cache_size", 8)
+    monkeypatch.setattr(Ui, "_raw_cache", None)
+
+    icon = '<svg class="icon"><path d="M0 0"></path></svg>'
+    first = ui.raw(icon)
+    first["class"].append("big")
+    first.path.decompose()  # pyright: ignore[reportOptionalMemberAccess]
+
+    second = ui.raw(icon)
+    assert first is not second
+    assert str(second) == icon
+    assert Ui._raw_cache.cache_info().hits == 1  # pyright: ignore[reportPrivateUsage, reportOptionalMemberAccess, reportFunctionMemberAccess]
+
+    fragment = ui.raw("<li>a</li><li>b</li>")
+    assert str(ui.raw("<li>a</li><li>b</li>")) == str(fragment) == "<li>a</li><li>b</li>"
+
+
+def test_ui_raw_parse_only():
+    html = '<div><header>Skip</header><div class="card">One</div><p>Skip</p><div class="card">Two</div></div>'
+
+    tag = ui.raw(html, parse_only=SoupStrainer(class_="card"))
+    assert str(tag) == '<div class="card">One</div><div class="card">Two</div>'
+
+    tag = ui.raw(html, parse_only=SoupStrainer("header"))
+    assert str(tag) == "<header>Skip</header>"
+
+    # Nothing matched, or only strings matched, never falls back to the unparsed input
+    assert not str(ui.raw(html, parse_only=SoupStrainer("nonexistent")))
+    assert str(ui.raw(html, parse_only=SoupStrainer(string="One"))) == "One"
+
+
 def test_ui_raw_multiple_root_elments():
     tag_string = "<div>First</div><div>Second</div>"
     tag = ui.raw(tag_string)
@@ -438,6 +586,15 @@ def test_ui_text():  # sourcery skip: extract-method, no-conditionals-in-tests
 
     assert str(container) == "<div>FirstSecond</div>"
 
+    # Without a parent a plain string is returned, with one the appended text node is
+    assert type(ui.text("Loose")) is str
+
+    with ui.div() as container:
+        node = ui.text("Attached")
+
+    assert isinstance(node, NavigableString)
+    assert node.parent is container
+
     # Test with nested content
     with ui.p() as para:
         ui.text("Start ")
@@ -635,6 +792,25 @@ def test_ui_comment():
     assert str(mixed[0]) == "<span>in a span</span>"
 
 
+def test_ui_comments():
+    html = """<div>
+    <!-- .button -->
+    <button>first</button>
+    <!-- #title -->
+    <h1>Title</h1>
+    <!-- .button -->
+    <button>second</button>
+    </div>"""
+
+    container = ui.raw(html)
+    found = container.comments([".button", "#title", "#missing"])
+
+    assert [str(tag) for tag in found[".button"]] == ["<button>first</button>", "<button>second</button>"]
+    assert [str(tag) for tag in found["#title"]] == ["<h1>Title</h1>"]
+    assert found["#missing"] == []
+    assert found[".button"] == container.comment(".button")
+
+
 def test_ui_replace_with():
     # Test basic replacement
     with ui.div() as container:
@@ -894,3 +1070,11 @@ def test_ui_raw_with_bytes():
     tag = ui.raw(utf8_bytes)
     assert tag.name == "p"
     assert "☃" in str(tag)
+
+    # Non UTF-8 content falls back to charset detection
+    latin1_bytes = (
+        "<p>Les élèves ont été très contents de la journée à la plage, où ils ont mangé des crêpes</p>"
+    ).encode("latin-1")
+    tag = ui.raw(latin1_bytes)
+    assert tag.name == "p"
+    assert "élèves" in str(tag)
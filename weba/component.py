@@ -22,13 +22,16 @@ from .errors import (
 )
 from .tag import Tag, current_tag_context
 from .tag_decorator import TagDecorator
-from .ui import ui
+from .ui import Ui, ui
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Callable
+    from collections.abc import Callable, Generator
 
 T = TypeVar("T", bound="Component")
 
+_LIFECYCLE_HOOKS = ("before_render", "render", "after_render")
+_MISSING = object()
+
 
 @contextmanager
 def no_tag_context():
@@ -45,15 +48,10 @@ def no_tag_context():
 class ComponentMeta(ABCMeta):
     """Metaclass for Component to handle automatic rendering."""
 
-    _cache_size: ClassVar[int | None] = None
-
     @classmethod
     def get_cache_size(cls) -> int | None:
-        """Get the LRU cache size from environment variable."""
-        if cls._cache_size is None:
-            size = os.getenv("WEBA_LRU_CACHE_SIZE")
-            cls._cache_size = int(size) if size else None
-        return cls._cache_size
+        """Get the LRU cache size from environment variable, shared with `ui.raw`."""
+        return Ui.get_cache_size()
 
     _tag_methods: ClassVar[list[str]]
 
@@ -71,9 +69,7 @@ class ComponentMeta(ABCMeta):
 
         # Add tag methods from parent classes
         for base in bases:
-            if hasattr(base, "_tag_methods"):
-                base_methods = getattr(base, "_tag_methods", [])
-                tag_methods.extend(base_methods)
+            tag_methods.extend(getattr(base, "_tag_methods", ()))
 
         # Remove duplicates while preserving order
         new_cls._tag_methods = list(dict.fromkeys(tag_methods))  # pyright: ignore[eportAttributeAccessIssue, reportAttributeAccessIssue]
@@ -81,6 +77,13 @@ class ComponentMeta(ABCMeta):
         # Inherit src and src_root_tag if not defined in this class
         cls._inherit_attrs(new_cls, namespace, bases, ["src", "src_root_tag"])
 
+        # Hooks are class-level, so which ones exist and whether any of them is async is known once the class exists
+        hooks = frozenset(hook for hook in _LIFECYCLE_HOOKS if callable(getattr(new_cls, hook, None)))
+        new_cls._lifecycle_hooks = hooks  # pyright: ignore[reportAttributeAccessIssue]
+        new_cls._has_async_hooks = any(  # pyright: ignore[reportAttributeAccessIssue]
+            inspect.iscoroutinefunction(getattr(new_cls, hook)) for hook in hooks
+        )
+
         return new_cls  # pyright: ignore[reportReturnType]
 
     # NOTE: This prevents the default __init__ method from being called
@@ -96,8 +99,8 @@ class ComponentMeta(ABCMeta):
         for attr_name in attrs:
             if attr_name not in namespace and bases:
                 for base in bases:
-                    if hasattr(base, attr_name):
-                        setattr(new_cls, attr_name, getattr(base, attr_name))  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
+                    if (value := getattr(base, attr_name, _MISSING)) is not _MISSING:
+                        setattr(new_cls, attr_name, value)  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
                         break
 
 
@@ -112,9 +115,11 @@ class Component(ABC, Tag, metaclass=ComponentMeta):
     """Allows you to specify the root_tag from the src as if using @tag("some_selector", root_tag=True)"""
     _tag_methods: ClassVar[list[str]]
     _called_with_context: bool
+    _lifecycle_hooks: ClassVar[frozenset[str]]
     _has_async_hooks: bool = False
     _doctype: str | None = None
     _cached_tags: dict[str, Tag]
+    _src_dir: ClassVar[str]
 
     def __new__(cls, *args: Any, **kwargs: Any):
         src, doctype = cls._get_source_content()
@@ -139,12 +144,7 @@ class Component(ABC, Tag, metaclass=ComponentMeta):
         if parent := current_tag_context.get():
             parent.append(instance)
 
-        instance._has_async_hooks = any(
-            inspect.iscoroutinefunction(getattr(instance, hook, None))
-            for hook in ["before_render", "render", "after_render"]
-        )
-
-        if not instance._has_async_hooks:
+        if not cls._has_async_hooks:
             instance._run_sync_hooks()
 
         return instance
@@ -172,9 +172,7 @@ class Component(ABC, Tag, metaclass=ComponentMeta):
             content = str(content)
 
         if content.endswith((".html", ".svg", ".xml")):
-            cls_path = inspect.getfile(cls)
-            cls_dir = os.path.dirname(cls_path)
-            base_path = cls_dir if content.startswith(".") else os.getcwd()
+            base_path = cls._get_src_dir() if content.startswith(".") else os.getcwd()
             path = str(Path(base_path, content))
 
             if not cls.src_parser and content.endswith((".svg", ".xml")):
@@ -184,17 +182,29 @@ class Component(ABC, Tag, metaclass=ComponentMeta):
 
         return Component._parse_content(content)
 
+    @classmethod
+    def _get_src_dir(cls) -> str:
+        """Directory of the module defining the component, used to resolve relative src paths."""
+        # NOTE: Read from the class __dict__, a subclass can live in a different module than its parent
+        if (src_dir := cls.__dict__.get("_src_dir")) is None:
+            src_dir = os.path.dirname(inspect.getfile(cls))
+            cls._src_dir = src_dir
+
+        return src_dir
+
     @classmethod
     def _get_source_content(cls) -> tuple[str | Tag | None, str | None]:
-        if not hasattr(cls, "src") and not hasattr(cls, "render"):
-            raise ComponentSrcRequiredError(cls)
+        src = getattr(cls, "src", _MISSING)
 
-        src = None
-        cache_size = cls.get_cache_size()
+        if src is _MISSING:
+            if not hasattr(cls, "render"):
+                raise ComponentSrcRequiredError(cls)
+
+            src = None
 
-        if hasattr(cls, "src"):
-            src = cls.src
+        cache_size = cls.get_cache_size()
 
+        if src is not None:
             if isinstance(src, Tag):
                 return lru_cache(maxsize=cache_size)(copy)(src), None  # Tags are already parsed, no need to cache
             elif callable(src):
@@ -216,74 +226,85 @@ class Component(ABC, Tag, metaclass=ComponentMeta):
 
     def _init_from_tag(self, root_tag: Tag) -> None:
         """Initialize component from a root tag."""
-        if hasattr(self, "src_root_tag") and self.src_root_tag:
+        # NOTE: Read from the class, on the instance a missing src_root_tag would fall through to bs4's tree search
+        if src_root_tag := getattr(self.__class__, "src_root_tag", None):
             # Try comment selector first if it starts with <!--
             if (
-                (self.src_root_tag.startswith("<!--"))
-                and (new_root := root_tag.comment_one(self.src_root_tag[4:-3].strip()))
-            ) or ((not self.src_root_tag.startswith("<!--")) and (new_root := root_tag.select_one(self.src_root_tag))):
+                (src_root_tag.startswith("<!--")) and (new_root := root_tag.comment_one(src_root_tag[4:-3].strip()))
+            ) or ((not src_root_tag.startswith("<!--")) and (new_root := root_tag.select_one(src_root_tag))):
                 root_tag = new_root
             else:
-                raise ComponentSrcRootTagNotFoundError(self.__class__, self.src_root_tag)
+                raise ComponentSrcRootTagNotFoundError(self.__class__, src_root_tag)
 
         self.replace_root_tag(root_tag)
 
     def replace_root_tag(self, root_tag: Tag):
         Tag.__init__(self, name=root_tag.name, attrs=root_tag.attrs)
-        self.extend(root_tag.contents.copy())
-        root_tag.decompose()
+        self._bulk_adopt(root_tag)
+
+        # NOTE: A detached root (the common single top-level tag case) is now empty and can simply be dropped
+        if root_tag.parent is not None:
+            root_tag.decompose()
 
         return self
 
+    def _get_hook(self, name: str) -> Callable[[], Any] | None:
+        """Get a lifecycle hook defined by the component class, without falling through to bs4's tree search."""
+        return getattr(self, name) if name in self._lifecycle_hooks else None
+
     def _run_sync_hooks(self) -> None:
         """Run synchronous lifecycle hooks."""
-        if callable(self.before_render):
+        if before_render := self._get_hook("before_render"):
             with no_tag_context():
-                self.before_render()
+                before_render()
 
         with no_tag_context():
             self._load_tag_methods()
 
-        if callable(self.render):
+        if render := self._get_hook("render"):
             with no_tag_context():
-                if response := self.render():
+                if response := render():
                     self._update_from_response(response)
 
-        if callable(self.after_render):
+        if after_render := self._get_hook("after_render"):
             with no_tag_context():
-                self.after_render()
+                after_render()
 
     async def _async_render_hooks(self):
-        if callable(self.before_render):
+        if before_render := self._get_hook("before_render"):
             with no_tag_context():
-                await self.before_render() if inspect.iscoroutinefunction(self.before_render) else self.before_render()
+                await before_render() if inspect.iscoroutinefunction(before_render) else before_render()
 
         with no_tag_context():
             self._load_tag_methods()
 
-        if callable(self.render):
+        if render := self._get_hook("render"):
             with no_tag_context():
-                if response := await self.render() if inspect.iscoroutinefunction(self.render) else self.render():
+                if response := await render() if inspect.iscoroutinefunction(render) else render():
                     self._update_from_response(response)
 
-        if not self._called_with_context and callable(self.after_render):
+        if not self._called_with_context and (after_render := self._get_hook("after_render")):
             with no_tag_context():
-                await self.after_render() if inspect.iscoroutinefunction(self.after_render) else self.after_render()
+                await after_render() if inspect.iscoroutinefunction(after_render) else after_render()
+
+        return self
 
+    def _rendered(self) -> Generator[Any, None, Component]:
+        # NOTE: Sync components already ran their hooks in __new__, so awaiting them just hands back the instance
+        yield from ()
         return self
 
     def __await__(self):
+        if not self._has_async_hooks:
+            return self._rendered()
+
         return self._async_render_hooks().__await__()
 
     def __enter__(self):
         if self._has_async_hooks:
             raise ComponentAsyncError(self.__class__)
 
-        if (
-            hasattr(self, "after_render")
-            and callable(self.after_render)
-            and not inspect.iscoroutinefunction(self.after_render)
-        ):
+        if (after_render := self._get_hook("after_render")) and not inspect.iscoroutinefunction(after_render):
             raise ComponentAfterRenderError(self.__class__)
 
         self._called_with_context = True
@@ -301,15 +322,17 @@ class Component(ABC, Tag, metaclass=ComponentMeta):
         self,
         *args: Any,
     ) -> None:
-        if callable(self.after_render):
+        if after_render := self._get_hook("after_render"):
             with no_tag_context():
-                await self.after_render() if inspect.iscoroutinefunction(self.after_render) else self.after_render()
+                await after_render() if inspect.iscoroutinefunction(after_render) else after_render()
 
         return super().__exit__(*args)
 
     def _load_tag_methods(self) -> None:
         # Execute tag decorators after contents are copied
-        for method_name in getattr(self.__class__, "_tag_methods", []):
+        # NOTE: These stay eager, the decorated methods are where components edit their template and a missing
+        # selector has to raise while the component is being built
+        for method_name in self._tag_methods:
             getattr(self, method_name)
 
     def __init__(self):
@@ -328,7 +351,7 @@ class Component(ABC, Tag, metaclass=ComponentMeta):
             response = response.copy()
 
         self.clear()
-        self.extend(response.contents)
+        self._bulk_adopt(response)
         self.name = response.name
         self.attrs = response.attrs
 
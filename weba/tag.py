@@ -4,14 +4,13 @@ import json
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal, overload
 
-from bs4 import Comment, NavigableString
+from bs4 import BeautifulSoup, Comment, NavigableString, PageElement
 from bs4 import Tag as Bs4Tag
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
     from contextvars import Token
 
-    from bs4 import BeautifulSoup, PageElement
     from bs4.builder import TreeBuilder
 
 # Context variable that tracks the current parent Tag during component rendering.
@@ -20,19 +19,51 @@ if TYPE_CHECKING:  # pragma: no cover
 current_tag_context: ContextVar[Tag | None] = ContextVar("__weba_current_tag_context__", default=None)
 
 
+def _copy_attrs(attrs: dict[str, Any]) -> dict[str, Any]:
+    """Copy attributes so list values, like the class list, aren't shared between a tag and its copy."""
+    return {key: value.copy() if isinstance(value, list) else value for key, value in attrs.items()}
+
+
+def _last_descendant(element: PageElement) -> PageElement:
+    """Get the last element inside `element` in document order, or `element` itself if it has no children."""
+    while isinstance(element, Bs4Tag) and element.contents:
+        element = element.contents[-1]
+
+    return element
+
+
 class Tag(Bs4Tag):
     @classmethod
     def from_existing_bs4tag(cls, bs4_tag: Bs4Tag) -> Tag:
-        new_tag = cls(name=bs4_tag.name, attrs=bs4_tag.attrs)
+        new_tag = cls(name=bs4_tag.name, attrs=_copy_attrs(bs4_tag.attrs))
+        previous: PageElement = new_tag
+
+        # Copy the source in document order with an explicit stack, linking each node straight into place instead of
+        # recursing and going through `append`, which re-derives the element chain on every insert
+        stack: list[tuple[PageElement, Tag]] = [(c, new_tag) for c in reversed(bs4_tag.contents)]
+
+        while stack:
+            c, parent = stack.pop()
 
-        for c in bs4_tag.contents:
             if isinstance(c, Bs4Tag):
-                child_tag = cls.from_existing_bs4tag(c)
-                new_tag.append(child_tag)
+                node = cls(name=c.name, attrs=_copy_attrs(c.attrs))
+                stack.extend((child, node) for child in reversed(c.contents))
             elif isinstance(c, Comment):
-                new_tag.append(Comment(c))
+                node = Comment(c)
             else:
-                new_tag.append(NavigableString(str(c)))
+                node = NavigableString(str(c))
+
+            node.parent = parent
+
+            if parent.contents:
+                node.previous_sibling = parent.contents[-1]
+                node.previous_sibling.next_sibling = node
+
+            parent.contents.append(node)
+
+            node.previous_element = previous
+            previous.next_element = node
+            previous = node
 
         return new_tag
 
@@ -108,14 +139,17 @@ class Tag(Bs4Tag):
             interesting_string_types=interesting_string_types,
             namespaces=namespaces,
         )
-        self._token: Token[Tag | None] | None = None
+        # One token per __enter__, so re-entering the same tag restores each level of the context on the way out
+        self._tokens: list[Token[Tag | None]] = []
+        self._class_list: list[str] | None = None
 
     def __enter__(self):
-        self._token = current_tag_context.set(self)  # pyright: ignore[reportArgumentType, reportAttributeAccessIssue]
+        self._tokens.append(current_tag_context.set(self))
         return self
 
     def __exit__(self, *args: Any) -> None:
-        current_tag_context.reset(self._token)  # pyright: ignore[reportArgumentType]
+        if tokens := self._tokens:
+            current_tag_context.reset(tokens.pop())
 
     @overload  # pragma: no cover # NOTE: We have tests that cover this case
     def __getitem__(self, key: Literal["class"]) -> list[str]:
@@ -131,19 +165,30 @@ class Tag(Bs4Tag):
         if key == "class":
             current_value = self.attrs.get("class")
 
-            if isinstance(current_value, str):
+            # The list handed out last time is still ours to return as long as attrs holds that same object
+            if current_value is not None and current_value is self._class_list:
+                return current_value
+
+            # NOTE: Each tag gets its own list, callers append to it in place so a shared empty list can't be used
+            if current_value is None:
+                current_value = []
+            elif isinstance(current_value, str):
                 current_value = current_value.split()
             elif not isinstance(current_value, list):
                 current_value = []
             else:
                 current_value = current_value.copy()  # pyright: ignore[reportUnknownVariableType]
 
-            self.attrs["class"] = current_value
+            self.attrs["class"] = self._class_list = current_value
 
             return current_value  # pyright: ignore[reportUnknownVariableType]
 
         value = self.attrs[key]
 
+        # Plain string values are by far the most common, so return them before the union isinstance check
+        if type(value) is str:
+            return value
+
         return json.dumps(value) if isinstance(value, dict | list) else value
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -178,26 +223,52 @@ class Tag(Bs4Tag):
         # results: list[Tag | NavigableString | None] = []
         results: list[Tag | None] = []
 
-        # Find all comment nodes matching the selector exactly
-        comments = self.find_all(string=lambda text: isinstance(text, str) and text.strip() == selector.strip())
+        for comment in self._matching_comments(selector):
+            if next_tag := self._tag_after_comment(comment):
+                results.append(next_tag)
 
-        for comment in comments:
-            # Get the next sibling of the comment
-            next_node = comment.next_sibling
+        return results
 
-            # Skip empty text nodes
-            while next_node and isinstance(next_node, NavigableString) and not next_node.strip():
-                next_node = next_node.next_sibling
+    def comments(self, selectors: Iterable[str]) -> dict[str, list[Tag | None]]:
+        """Find the tags that follow comments for several selectors at once.
+
+        Gives the same results as calling `comment` for each selector, but walks the tree a single time.
+
+        Args:
+            selectors: The comment texts to search for (e.g., ["#button", ".card"])
+
+        Returns:
+            A dict mapping each selector to the list of tags `comment` would return for it.
+        """
+        results: dict[str, list[Tag | None]] = {selector: [] for selector in selectors}
+        by_text: dict[str, list[list[Tag | None]]] = {}
 
-            if isinstance(next_node, Tag):
-                # Convert to our Tag but preserve comments
-                results.append(next_node)
-            # elif isinstance(next_node, NavigableString) and (text := next_node.strip()):
-            #     # Return the NavigableString as-is
-            #     results.append(NavigableString(text))
+        for selector, matches in results.items():
+            by_text.setdefault(selector.strip(), []).append(matches)
+
+        for node in self.descendants:
+            if (
+                isinstance(node, Comment)
+                and (selector_matches := by_text.get(node.strip()))
+                and (next_tag := self._tag_after_comment(node))
+            ):
+                for matches in selector_matches:
+                    matches.append(next_tag)
 
         return results
 
+    @staticmethod
+    def _tag_after_comment(comment: PageElement) -> Tag | None:
+        """Get the tag right after a comment, skipping whitespace-only text nodes."""
+        # Get the next sibling of the comment
+        next_node = comment.next_sibling
+
+        # Skip empty text nodes
+        while isinstance(next_node, NavigableString) and (not next_node or next_node.isspace()):
+            next_node = next_node.next_sibling
+
+        return next_node if isinstance(next_node, Tag) else None
+
     # def comment_one(self, selector: str) -> Tag | NavigableString | None:
     def comment_one(self, selector: str) -> Tag | None:
         """Find the first tag or text node that follows a comment matching the given selector.
@@ -213,10 +284,8 @@ class Tag(Bs4Tag):
             A Tag object if the next element is an HTML tag, or a NavigableString if it's a text node.
             Returns None if no match is found.
         """
-        # Find all comment nodes matching the selector exactly
-        comments = self.find_all(string=lambda text: isinstance(text, str) and text.strip() == selector.strip())
-
-        for comment in comments:
+        # Comments are matched lazily, so the walk stops at the first one followed by a tag
+        for comment in self._matching_comments(selector):
             # Get the next sibling of the comment
             next_node = comment.next_sibling
             while next_node:
@@ -232,6 +301,113 @@ class Tag(Bs4Tag):
 
         return None
 
+    def _matching_comments(self, selector: str) -> Iterator[Comment]:
+        """Yield the comments below this tag whose text matches the selector exactly, ignoring surrounding whitespace.
+
+        Walks the descendants once and only strips comment nodes, instead of running a `find_all` string callback on
+        every text node.
+        """
+        selector = selector.strip()
+
+        for node in self.descendants:
+            # The substring check rejects most comments without allocating a stripped copy
+            if isinstance(node, Comment) and selector in node and node.strip() == selector:
+                yield node
+
+    def extend(self, tags: Iterable[PageElement | str] | Bs4Tag) -> None:
+        """Append the given elements to this tag's contents.
+
+        Behaves like `bs4.Tag.extend`, but links the whole batch into the tree in one pass instead of running a full
+        `insert` for every element.
+
+        Args:
+            tags: The elements to append. If a Tag is given, its children are moved instead.
+        """
+        children = list(tags.contents if isinstance(tags, Bs4Tag) else tags)
+
+        # Leave the cases bs4 rejects (like None), unpacks (a BeautifulSoup) or moves more than once (a repeated element)
+        # to bs4
+        if len({id(child) for child in children}) != len(children) or any(
+            child is self or isinstance(child, BeautifulSoup) or not isinstance(child, PageElement | str)  # pyright: ignore[reportUnnecessaryIsInstance]
+            for child in children
+        ):
+            super().extend(children)
+            return
+
+        elements: list[PageElement] = []
+
+        for child in children:
+            if isinstance(child, str) and not isinstance(child, NavigableString):
+                child = NavigableString(child)
+            elif child.parent is not None:
+                child.extract()
+
+            elements.append(child)
+
+        # The batch goes between this tag's last descendant and whatever follows this tag in its tree
+        previous = _last_descendant(self)
+        following = previous.next_element
+        previous_sibling = self.contents[-1] if self.contents else None
+
+        for element in elements:
+            element.parent = self
+            element.previous_sibling = previous_sibling
+
+            if previous_sibling is not None:
+                previous_sibling.next_sibling = element
+
+            element.previous_element = previous
+            previous.next_element = element
+            previous_sibling = element
+            previous = _last_descendant(element)
+
+        if previous_sibling is not None:
+            previous_sibling.next_sibling = None
+
+        previous.next_element = following
+
+        if following is not None:
+            following.previous_element = previous
+
+        self.contents.extend(elements)
+
+    def _bulk_adopt(self, source: Tag) -> None:
+        """Move all of `source`'s children into this empty tag in a single pass.
+
+        Unlike `extend`, this keeps the children's existing element chain and only relinks its two ends, instead of
+        extracting and re-inserting every child.
+
+        Args:
+            source: The tag to take the children from. It is left empty, but stays where it is in its own tree.
+        """
+        contents = source.contents
+
+        if not contents:
+            return
+
+        last_descendant = _last_descendant(contents[-1])
+        following = last_descendant.next_element
+
+        # Close the gap left in the source tree
+        source.contents = []
+        source.next_element = following
+
+        if following is not None:
+            following.previous_element = source
+
+        # While empty, this tag's next element is whatever follows it in its own tree
+        if (following := self.next_element) is not None:
+            following.previous_element = last_descendant
+
+        last_descendant.next_element = following
+
+        for child in contents:
+            child.parent = self
+
+        self.contents = contents
+        self.next_element = contents[0]
+        contents[0].previous_element = self
+
     def __iter__(self) -> Iterator[PageElement]:
         """Iterate over children, creating a static list to prevent modification during iteration."""
         return iter(list(self.contents))
@@ -345,10 +345,14 @@ class Tag(PageElement):
         formatter: Literal["html", "html5", "minimal"] | Formatter | None = "minimal",
     ) -> str: ...
     def copy(self) -> Self: ...
+    def extend(self, tags: Iterable[PageElement | str] | Tag) -> None: ...
+    def _matching_comments(self, selector: str) -> Iterator[Comment]: ...
+    def _bulk_adopt(self, source: Tag) -> None: ...
     def __enter__(self) -> Self: ...
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
     def comment(self, text: str) -> Comment: ...
     def comment_one(self, selector: str) -> Tag | None: ...
+    def comments(self, selectors: Iterable[str]) -> dict[str, list[Tag | None]]: ...
     # def comment_one(self, selector: str) -> Tag | NavigableString | None: ...
     def encode_contents(
         self,
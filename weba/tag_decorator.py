@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import methodcaller
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from .errors import ComponentTagNotFoundError
@@ -13,9 +14,15 @@ if TYPE_CHECKING:  # pragma: no cover
 T = TypeVar("T", bound="Component")
 
 
+def _identity(instance: T) -> T:
+    return instance
+
+
 class TagDecorator(Generic[T]):
     """Descriptor for tag-decorated methods."""
 
+    __slots__ = ("__name__", "_pass_tag", "_resolve", "clear", "extract", "method", "root_tag", "selector")
+
     def __init__(
         self,
         method: Callable[[T, Tag], Tag | T | None] | Callable[[T], Tag | T | None],
@@ -30,6 +37,21 @@ class TagDecorator(Generic[T]):
         self.clear = clear
         self.root_tag = root_tag
         self.__name__ = method.__name__
+        self._resolve = self._resolver(selector)
+        # Whether the decorated method takes the matched tag, this can't change after decoration
+        self._pass_tag = method.__code__.co_argcount == 2  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _resolver(selector: str) -> Callable[[T], Tag | T | None]:
+        """Pick how the selector is looked up once, at decoration time, instead of on every access."""
+        if not selector:
+            return _identity
+
+        if selector.startswith("<!--"):
+            # Strip HTML comment markers and whitespace
+            return methodcaller("comment_one", selector[4:-3].strip())
+
+        return methodcaller("select_one", selector)
 
     def __set__(self, instance: T, value: Tag):
         getattr(instance, self.method.__name__).replace_with(value)
@@ -37,18 +59,11 @@ class TagDecorator(Generic[T]):
 
     def __get__(self, instance: T, owner: type[T]):
         # Return cached result if it exists
-        if response := instance._cached_tags.get(self.__name__):  # pyright: ignore[reportPrivateUsage]
+        if (response := instance._cached_tags.get(self.__name__)) is not None:  # pyright: ignore[reportPrivateUsage]
             return response
 
-        if not self.selector:
-            tag = instance
         # Find tag using selector if provided
-        elif self.selector.startswith("<!--"):
-            # Strip HTML comment markers and whitespace
-            stripped_selector = self.selector[4:-3].strip()
-            tag = instance.comment_one(stripped_selector)  # type: ignore[attr-defined]
-        else:
-            tag = instance.select_one(self.selector)  # type: ignore[attr-defined]
+        tag = self._resolve(instance)
 
         if not tag:
             raise ComponentTagNotFoundError(self.selector, self.__name__, owner)
@@ -61,8 +76,7 @@ class TagDecorator(Generic[T]):
             tag.extract()
 
         # Call the decorated method
-        argcount = self.method.__code__.co_argcount  # type: ignore[attr-defined]
-        method_result = self.method(instance, tag) if argcount == 2 else self.method(instance)  # pyright: ignore[reportArgumentType, reportCallIssue]
+        method_result = self.method(instance, tag) if self._pass_tag else self.method(instance)  # pyright: ignore[reportArgumentType, reportCallIssue]
 
         # If method returns a value directly without needing the tag, use that
         if method_result is not None:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from bs4 import BeautifulSoup, NavigableString
@@ -12,16 +14,62 @@ from .tag import Tag, current_tag_context
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable, Sequence
 
+    from bs4 import SoupStrainer
+
+# A single empty tag without attributes, e.g. <br>, <hr/> or <div></div>
+_SIMPLE_TAG = re.compile(r"\s*<([a-zA-Z][a-zA-Z0-9-]*)\s*/?>(?:</\1>)?\s*")
+_SIMPLE_TAG_PARSERS = frozenset(("html.parser", "lxml"))
+_LXML_WRAPPED_TAGS = frozenset(("frame", "frameset", "noframes"))
+
+
+@lru_cache(maxsize=1024)
+def _translate_key(key: str) -> str:
+    """Convert a keyword argument name to an attribute name, e.g. class_ to class and hx_get to hx-get."""
+    return key.rstrip("_").replace("_", "-")
+
+
+def _convert_attrs(kwargs: dict[str, str | int | float | Sequence[Any]]) -> dict[str, Any]:
+    """Convert keyword arguments to tag attributes."""
+    # Convert underscore attributes to dashes
+    converted_kwargs: dict[str, Any] = {}
+
+    for key, value in kwargs.items():
+        # False boolean attributes are left off, the same as setting them to False with tag[key] = False
+        if value is False:
+            continue
+
+        key = _translate_key(key)
+
+        if key == "class":
+            if isinstance(value, list | tuple):
+                # Most class lists are all strings, which can be joined without converting or filtering each one
+                value = (
+                    " ".join(value)
+                    if all(type(v) is str for v in value)
+                    else " ".join(str(v) for v in value if isinstance(v, str | int | float))
+                )
+        else:
+            # Handle boolean attributes
+            if value is True:
+                value = None
+
+        converted_kwargs[key] = value
+
+    return converted_kwargs
+
 
 class Ui:
     """A factory class for creating UI elements using BeautifulSoup."""
 
     _html_parser: ClassVar[str | None] = None
     _xml_parser: ClassVar[str | None] = None
+    # Read once at import, so an unset variable isn't looked up again on every raw() call
+    _cache_size: ClassVar[int | None] = int(size) if (size := os.getenv("WEBA_LRU_CACHE_SIZE")) else None
+    _raw_cache: ClassVar[Callable[[str, str | None], Tag] | None] = None
 
     @classmethod
     def get_html_parser(cls) -> str | None:
-        """Get the LRU cache size from environment variable."""
+        """Get the HTML parser from environment variable."""
         if cls._html_parser is None:
             cls._html_parser = os.getenv("WEBA_HTML_PARSER", "html.parser")
 
@@ -35,6 +83,11 @@ class Ui:
 
         return cls._xml_parser
 
+    @classmethod
+    def get_cache_size(cls) -> int | None:
+        """Get the LRU cache size read from the environment variable."""
+        return cls._cache_size
+
     def text(self, html: str | int | float | Sequence[Any] | None) -> str:
         """Create a raw text node from a string.
 
@@ -44,15 +97,18 @@ class Ui:
         Returns:
             A string containing the text.
         """
-        text = NavigableString("" if html is None else str(html))
+        text = "" if html is None else str(html)
+
+        # Return the raw string only when no parent (for direct usage), bs4 wraps it if it's appended later
+        if not (parent := current_tag_context.get()):
+            return text
 
         # # Only append to parent if we're creating a new text node
         # # This prevents double-appending when the text is used in other operations
-        if parent := current_tag_context.get():
-            parent.append(text)
+        node = NavigableString(text)
+        parent.append(node)
 
-        # Return the raw string only when no parent (for direct usage)
-        return text
+        return node
 
     def _handle_lxml_parser(self, html: str, parsed: BeautifulSoupTag) -> Tag | BeautifulSoupTag:
         stripped_html = html.strip().lower()
@@ -66,81 +122,109 @@ class Ui:
 
         return parsed
 
-    def raw(self, html: str | bytes, parser: str | None = None) -> Tag:
+    def raw(self, html: str | bytes, parser: str | None = None, parse_only: SoupStrainer | None = None) -> Tag:
         """Create a Tag from a raw HTML string.
 
         Args:
             html: Raw HTML string to parse
+            parser: The BeautifulSoup parser to use, defaults to WEBA_HTML_PARSER or WEBA_XML_PARSER
+            parse_only: Only build the parts of the document matching this strainer, skipping the rest of the tree
 
         Returns:
             Tag: A new Tag object containing the parsed HTML
         """
         if isinstance(html, bytes):
-            html = str(from_bytes(html).best())
+            # Most input is UTF-8 (or plain ASCII), only run the much slower charset detection when that fails
+            try:
+                html = html.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                html = str(from_bytes(html).best())
+
+        if not parser:
+            # NOTE: Read the cached parser names directly and only fall back to the getters to resolve them the first time
+            if html.startswith("<?xml"):
+                parser = self._xml_parser or self.get_xml_parser()
+            else:
+                parser = self._html_parser or self.get_html_parser()
 
-        parser = parser or (
-            self.__class__.get_xml_parser() if html.startswith("<?xml") else self.__class__.get_html_parser()
-        )
+        if parse_only is None and (simple_tag := self._simple_tag_name(html, parser)):
+            # A lone empty tag like <br> or <div></div> comes out of every HTML parser the same way, skip parsing it
+            tag = Tag(name=simple_tag)
+        elif parse_only is None and self.get_cache_size():
+            tag = self._parse_cached(html, parser)
+        else:
+            tag = self._parse(html, parser, parse_only)
 
-        parsed = BeautifulSoup(html, parser)
+        if parent := current_tag_context.get():
+            parent.append(tag)
+
+        return tag
+
+    @staticmethod
+    def _simple_tag_name(html: str, parser: str | None) -> str | None:
+        if parser not in _SIMPLE_TAG_PARSERS or not (match := _SIMPLE_TAG.fullmatch(html)):
+            return None
+
+        name = match[1].lower()
+
+        # NOTE: lxml wraps these in an html tag
+        return None if parser == "lxml" and name in _LXML_WRAPPED_TAGS else name
+
+    def _parse_cached(self, html: str, parser: str | None) -> Tag:
+        """Parse through an LRU cache, so the same raw HTML (icons, SVGs, static snippets) is only parsed once."""
+        cls = self.__class__
+
+        if cls._raw_cache is None:
+            cls._raw_cache = lru_cache(maxsize=self.get_cache_size())(partial(self._parse, parse_only=None))
+
+        # Hand out a copy, callers are free to change the tag and the cached one has to stay as parsed
+        cached = cls._raw_cache(html, parser)
+        tag = cached.copy()
+        tag.hidden = cached.hidden
+
+        return tag
+
+    def _parse(self, html: str, parser: str | None, parse_only: SoupStrainer | None) -> Tag:
+        parsed = BeautifulSoup(html, parser, parse_only=parse_only)
 
         # NOTE: This is to html lxml always wrapping in html > body tags
         if parser == "lxml":
             parsed = self._handle_lxml_parser(html, parsed)
 
-        # Count root elements
-        root_elements = [child for child in parsed.children if isinstance(child, BeautifulSoupTag)]
+        # Only look as far as the second root element to tell a single root from a fragment
+        roots = (child for child in parsed.children if isinstance(child, BeautifulSoupTag))
+        first, second = next(roots, None), next(roots, None)
 
-        if len(root_elements) == 1:
+        if first is not None and second is None:
             # Single root element - return it directly
-            tag = Tag.from_existing_bs4tag(root_elements[0])
+            tag = Tag.from_existing_bs4tag(first)
         else:
+            root_elements = [first, second, *roots] if first is not None and second is not None else []
+
             # Multiple root elements or text only - handle as fragments
             tag = Tag(name="fragment")
             tag.string = ""
 
             if root_elements:
-                # Add all root elements
-                for child in root_elements:
-                    tag.append(Tag.from_existing_bs4tag(child))
+                # Add all root elements, linking them in one pass rather than appending one at a time
+                tag.extend([Tag.from_existing_bs4tag(child) for child in root_elements])
             else:
-                # Text only content
-                tag.string = html
+                # Text only content, with a strainer only the strings it kept (if any) were parsed
+                tag.string = html if parse_only is None else parsed.get_text()
 
             # Ensure fragment tag doesn't render
             tag.hidden = True
 
-        if parent := current_tag_context.get():
-            parent.append(tag)
-
         return tag
 
     def __getattr__(self, tag_name: str) -> Callable[..., Tag]:
-        def create_tag(*args: Any, **kwargs: str | int | float | Sequence[Any]) -> Tag:
-            # Convert underscore attributes to dashes
-            converted_kwargs: dict[str, Any] = {}
-
-            for key, value in kwargs.items():
-                key = key.rstrip("_").replace("_", "-")
-
-                if key == "class":
-                    if isinstance(value, list | tuple):
-                        value = " ".join(str(v) for v in value if isinstance(v, str | int | float))
-                else:
-                    # Handle boolean attributes
-                    if isinstance(value, bool) and value:
-                        value = None
-
-                converted_kwargs[key] = value
-
-            # Create a BeautifulSoupTag directly
-            base_tag = BeautifulSoupTag(
-                name=tag_name,
-                attrs=converted_kwargs,
-            )
+        # A trailing underscore lets tag names that clash with Python names be used, e.g. ui.input_ or ui.del_
+        name = tag_name.rstrip("_")
+        get_parent = current_tag_context.get
 
-            # Wrap it into our Tag class
-            tag_obj = Tag.from_existing_bs4tag(base_tag)
+        def create_tag(*args: Any, **kwargs: str | int | float | Sequence[Any]) -> Tag:
+            # NOTE: bs4 copies the attrs dict it is given, so skip building an empty one when there are no attributes
+            tag_obj = Tag(name=name, attrs=_convert_attrs(kwargs) if kwargs else None)
 
             # Handle content
             if args:
@@ -153,11 +237,14 @@ class Ui:
                     tag_obj.string = str(arg)
 
             # If there's a current parent, append this tag to it
-            if parent := current_tag_context.get():
+            if parent := get_parent():
                 parent.append(tag_obj)
 
             return tag_obj
 
+        # Keep the factory on the instance, so later lookups of this tag name don't reach __getattr__ again
+        setattr(self, tag_name, create_tag)
+
         return create_tag
 
 